@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled bond screening used by :func:`moleview.src.atom.find_bonds`.
+
+"""
+
+import numpy as np
+
+
+cpdef find_bonds_c(const signed char[::1] is_h, const float[:, ::1] coord, double cg2, double ch2):
+    """
+    Screen all atom pairs by global and hydrogen cutoff.
+
+    Parameters
+    ----------
+    is_h : array
+        1 if atom is hydrogen, 0 otherwise, int8, shape (N,).
+    coord : array
+        C-contiguous float32 atomic coordinates, shape (N, 3).
+    cg2 : float
+        Squared global cutoff.
+    ch2 : float
+        Squared hydrogen cutoff.
+
+    Returns
+    -------
+    pair_i, pair_j : array
+        Indices of both atoms of each accepted bond.
+
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t n = coord.shape[0]
+    cdef Py_ssize_t k = 0
+    cdef double dx, dy, dz, d2
+
+    out_i = np.empty(n * (n - 1) // 2, dtype=np.intc)
+    out_j = np.empty(n * (n - 1) // 2, dtype=np.intc)
+    cdef int[::1] pair_i = out_i
+    cdef int[::1] pair_j = out_j
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            dx = coord[i, 0] - coord[j, 0]
+            dy = coord[i, 1] - coord[j, 1]
+            dz = coord[i, 2] - coord[j, 2]
+            d2 = dx * dx + dy * dy + dz * dz
+
+            if d2 > cg2:
+                continue
+            if (is_h[i] or is_h[j]) and d2 > ch2:
+                continue
+
+            pair_i[k] = i
+            pair_j[k] = j
+            k += 1
+
+    return out_i[:k], out_j[:k]
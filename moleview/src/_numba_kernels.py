@@ -0,0 +1,102 @@
+"""
+MIT License
+
+Copyright (c) 2020-2021 Rangsiman Ketkaew
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _find_bonds_numpy(coords, is_h, cg2, ch2):
+    """
+    Screen all atom pairs with NumPy, used when Numba is not installed.
+
+    Parameters
+    ----------
+    coords : array
+        Atomic coordinates, shape (N, 3).
+    is_h : array
+        1 if atom is hydrogen, 0 otherwise, shape (N,).
+    cg2 : float
+        Squared global cutoff.
+    ch2 : float
+        Squared hydrogen cutoff.
+
+    Returns
+    -------
+    pair_i, pair_j : array
+        Indices of both atoms of each accepted bond.
+
+    """
+    n = coords.shape[0]
+    i, j = np.triu_indices(n, 1)
+    diff = coords[i] - coords[j]
+    d2 = np.einsum("ij,ij->i", diff, diff)
+
+    with_h = (is_h[i] != 0) | (is_h[j] != 0)
+    mask = (d2 <= cg2) & (~with_h | (d2 <= ch2))
+
+    return i[mask].astype(np.int32), j[mask].astype(np.int32)
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def _find_bonds_kernel(coords, is_h, cg2, ch2):
+        """
+        Screen all atom pairs in compiled code.
+
+        Same parameters and returns as :func:`_find_bonds_numpy`.
+
+        """
+        n = coords.shape[0]
+        pair_i = np.empty(n * (n - 1) // 2, np.int32)
+        pair_j = np.empty(n * (n - 1) // 2, np.int32)
+        k = 0
+
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = coords[i, 0] - coords[j, 0]
+                dy = coords[i, 1] - coords[j, 1]
+                dz = coords[i, 2] - coords[j, 2]
+                d2 = dx * dx + dy * dy + dz * dz
+
+                if d2 > cg2:
+                    continue
+                if (is_h[i] or is_h[j]) and d2 > ch2:
+                    continue
+
+                pair_i[k] = i
+                pair_j[k] = j
+                k += 1
+
+        return pair_i[:k], pair_j[:k]
+
+else:
+    _find_bonds_kernel = _find_bonds_numpy
@@ -22,11 +22,11 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import numpy as np
 from matplotlib import pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 
-from .atom import check_atom, check_radii, check_color, find_bonds
+from .atom import _ATOMS, _COLOR_ARR, _RADII, _SYM_TO_Z, find_bonds
 
 
 class DrawComplex:
@@ -64,6 +64,25 @@ class DrawComplex:
 
     """
 
+    __slots__ = (
+        "atom",
+        "coord",
+        "cutoff_global",
+        "cutoff_hydrogen",
+        "title_name",
+        "title_size",
+        "label_size",
+        "show_title",
+        "show_axis",
+        "show_grid",
+        "bond_list",
+        "fig",
+        "ax",
+        "_Z",
+        "_colors",
+        "_sizes",
+    )
+
     def __init__(self, atom=None, coord=None, cutoff_global=2.0, cutoff_hydrogen=1.2):
         self.atom = atom
         self.coord = coord
@@ -82,9 +101,13 @@ class DrawComplex:
         self.show_axis = True
         self.show_grid = True
 
-        self.atoms_pair = []
         self.bond_list = None
 
+        # per-atom atomic number, color, and marker size
+        self._Z = np.fromiter((_SYM_TO_Z[a] for a in self.atom), dtype=np.int8, count=len(self.atom))
+        self._colors = _COLOR_ARR[self._Z]
+        self._sizes = _RADII[self._Z] * 300
+
         self.start_plot()
 
     def start_plot(self):
@@ -93,29 +116,33 @@ class DrawComplex:
 
         """
         self.fig = plt.figure()
-        self.ax = Axes3D(self.fig)
+        self.ax = self.fig.add_subplot(111, projection="3d")
 
         self.ax.set_title("Full complex", fontsize="12")
-        # ax = fig.add_subplot(111, projection='3d')
 
     def add_atom(self):
         """
         Add all atoms to show in figure.
 
+        Atoms of the same element are drawn with a single scatter call.
+
         """
-        for i in range(len(self.coord)):
-            # Determine atomic number
-            n = check_atom(self.atom[i])
+        coords = np.asarray(self.coord)
+
+        # one scatter per element, in order of first appearance
+        _, first = np.unique(self._Z, return_index=True)
+        for k in np.sort(first):
+            m = self._Z == self._Z[k]
             self.ax.scatter(
-                self.coord[i][0],
-                self.coord[i][1],
-                self.coord[i][2],
+                coords[m, 0],
+                coords[m, 1],
+                coords[m, 2],
                 marker="o",
                 linewidths=0.5,
                 edgecolors="black",
-                color=check_color(n),
-                label=f"{self.atom[i]}",
-                s=check_radii(n) * 300,
+                color=self._colors[k],
+                label=_ATOMS[self._Z[k]],
+                s=self._sizes[m],
             )
 
     def add_symbol(self):
@@ -143,43 +170,31 @@ class DrawComplex:
         """
         _, self.bond_list = find_bonds(self.atom, self.coord, self.cutoff_global, self.cutoff_hydrogen)
 
-        for i in range(len(self.bond_list)):
-            get_atoms = self.bond_list[i]
-            x, y, z = zip(*get_atoms)
-            atoms = list(zip(x, y, z))
-            self.atoms_pair.append(atoms)
-
-        for i in range(len(self.atoms_pair)):
-            merge = list(zip(self.atoms_pair[i][0], self.atoms_pair[i][1]))
-            x, y, z = merge
-            self.ax.plot(x, y, z, "k-", color="black", linewidth=2)
+        # all bonds as one collection of (M, 2, 3) segments
+        if len(self.bond_list) > 0:
+            lc = Line3DCollection(self.bond_list, colors="black", linewidths=2)
+            self.ax.add_collection3d(lc)
 
     def add_legend(self):
         """
         Add atoms legend to show in figure.
 
+        add_atom draws one artist per element, so labels are already unique.
+
         References
         ----------
-        1. Remove duplicate labels in legend.
-            Ref: https://stackoverflow.com/a/26550501/6596684.
-
-        2. Fix size of point in legend.
+        1. Fix size of point in legend.
             Ref: https://stackoverflow.com/a/24707567/6596684.
 
         """
-        # remove duplicate labels
-        handles, labels = self.ax.get_legend_handles_labels()
-        handle_list, label_list = [], []
-
-        for handle, label in zip(handles, labels):
-            if label not in label_list:
-                handle_list.append(handle)
-                label_list.append(label)
-        leg = plt.legend(handle_list, label_list, loc="lower left", scatterpoints=1, fontsize=12)
+        leg = plt.legend(loc="lower left", scatterpoints=1, fontsize=12)
 
         # fix size of point in legend
-        for i in range(len(leg.legendHandles)):
-            leg.legendHandles[i]._sizes = [90]
+        handles = getattr(leg, "legend_handles", None)
+        if handles is None:
+            handles = leg.legendHandles
+        for handle in handles:
+            handle._sizes = [90]
 
     def config_plot(self, show_title=True, show_axis=True, show_grid=True, **kwargs):
         """
@@ -32,11 +32,16 @@ SOFTWARE.
 ##########################
 
 import argparse
-import re
+import mmap
 import pprint
 
+import numpy as np
+
 from .draw import DrawComplex
 
+# Fortran-style exponents: 1.0D+01 and 1.0*^01 both become 1.0e+01
+_EXPONENT_TABLE = str.maketrans({"d": "e", "D": "e", "*": "e", "^": None})
+
 def visualize(atom, coord):
     """Visualize molecule
 
@@ -53,6 +58,40 @@ def visualize(atom, coord):
     mol.show_plot()
 
 
+def _read_xyz_fallback(filename):
+    """Read XYZ file line by line, accepting D and *^ exponents
+
+    Args:
+        filename (str): Path to XYZ file
+
+    Returns:
+        atoms (list): Atomic symbol
+        coords (array): Cartesian coordinate
+    """
+
+    atoms = []
+
+    # Map the file and read it line by line
+    with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        num_atoms = int(mm.readline())
+        # skip comment line
+        mm.readline()
+
+        # Fill coordinates in place
+        coords = np.empty((num_atoms, 3), dtype=np.float32)
+        for _ in range(num_atoms):
+            parts = mm.readline().decode("ascii").split()
+            if len(parts) < 4:
+                continue
+            try:
+                coords[len(atoms)] = [float(val.translate(_EXPONENT_TABLE)) for val in parts[1:4]]
+            except ValueError:
+                continue
+            atoms.append(parts[0])
+
+    return atoms, coords[: len(atoms)]
+
+
 def main():
     # Read xyz file
     description = "MoleView: view your molecule anywhere and anytime."
@@ -60,28 +99,21 @@ def main():
     parser.add_argument('input', metavar='INPUT', type=str, help='Coordinate of molecule in XYZ format (.xyz)')
 
     args = parser.parse_args()
-    f = open(args.input, "r")
 
-    lines = f.read().split("\n")
-    f.close()
+    with open(args.input, "rb") as f:
+        num_atoms = int(f.readline())
 
-    num_atoms = int(lines[0])
-    atoms = []
-    coords = []
-
-    # Compile regex
-    coord_patt = re.compile(r"(\w+)\s+([0-9\-\+\.*^eEdD]+)\s+([0-9\-\+\.*^eEdD]+)\s+" r"([0-9\-\+\.*^eEdD]+)")
-    # Extract xyz
-    for i in range(2, 2 + num_atoms):
-        m = coord_patt.search(lines[i])
-        if m:
-            atoms.append(m.group(1))
-            xyz = [val.lower().replace("d", "e").replace("*^", "e") for val in m.groups()[1:4]]
-            coords.append([float(val) for val in xyz])
+    # Parse standard files in C, fall back for non-standard number formats
+    try:
+        atoms = np.loadtxt(args.input, skiprows=2, usecols=0, max_rows=num_atoms, dtype=str, ndmin=1).tolist()
+        coords = np.loadtxt(
+            args.input, skiprows=2, usecols=(1, 2, 3), max_rows=num_atoms, dtype=np.float32, ndmin=2
+        )
+    except ValueError:
+        atoms, coords = _read_xyz_fallback(args.input)
 
     visualize(atoms, coords)
 
-
 if __name__ == "__main__":
     main()
     
\ No newline at end of file
@@ -1,4 +1,27 @@
 import setuptools
+from setuptools.command.build_ext import build_ext
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    # Without Cython, find_bonds falls back to Numba or NumPy
+    ext_modules = []
+else:
+    ext_modules = cythonize([setuptools.Extension("moleview.src._bonds", ["moleview/src/_bonds.pyx"])])
+    # a failed compile still leaves a working pure-Python install
+    for ext in ext_modules:
+        ext.optional = True
+
+
+class BuildExt(build_ext):
+    """Add optimization flags understood by GCC and Clang but not MSVC."""
+
+    def build_extensions(self):
+        if self.compiler.compiler_type != "msvc":
+            for ext in self.extensions:
+                ext.extra_compile_args = ["-O3", "-ffast-math"]
+        super().build_extensions()
+
 
 with open("README.md", "r") as fh:
     long_description = fh.read()
@@ -14,6 +37,8 @@ setuptools.setup(
     url="https://github.com/moleview/moleview",
     download_url="https://github.com/moleview/moleview/releases",
     packages=setuptools.find_packages(),
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": BuildExt},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,88 @@
+"""
+Check that every bond search backend finds the same bonds.
+
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from moleview.src import atom
+from moleview.src._numba_kernels import _find_bonds_numpy
+
+XYZ_DIR = os.path.join(os.path.dirname(__file__), os.pardir, "test_xyz")
+
+CUTOFF_GLOBAL = 2.0
+CUTOFF_HYDROGEN = 1.2
+
+
+def read_xyz(name):
+    path = os.path.join(XYZ_DIR, name)
+    with open(path) as f:
+        num_atoms = int(f.readline())
+    labels = np.loadtxt(path, skiprows=2, usecols=0, max_rows=num_atoms, dtype=str, ndmin=1).tolist()
+    coords = np.loadtxt(path, skiprows=2, usecols=(1, 2, 3), max_rows=num_atoms, dtype=np.float32, ndmin=2)
+    return labels, coords
+
+
+def replicate(labels, coords, copies, spacing=20.0):
+    """Place copies of a molecule far enough apart that they cannot bond."""
+    shifts = np.arange(copies, dtype=np.float32)[:, None, None] * np.array([spacing, 0, 0], dtype=np.float32)
+    return labels * copies, np.ascontiguousarray((coords[None] + shifts).reshape(-1, 3))
+
+
+def backend_pairs(labels, coords):
+    coords = np.ascontiguousarray(coords, dtype=np.float32).reshape(-1, 3)
+    is_h = np.fromiter((label == "H" for label in labels), dtype=np.int8, count=len(labels))
+    cg2, ch2 = CUTOFF_GLOBAL ** 2, CUTOFF_HYDROGEN ** 2
+
+    results = {
+        "kdtree": atom._find_bonds_kdtree(coords, is_h, CUTOFF_GLOBAL, CUTOFF_HYDROGEN),
+        "kernel": atom._find_bonds_kernel(coords, is_h, cg2, ch2),
+        "numpy": _find_bonds_numpy(coords, is_h, cg2, ch2),
+    }
+    if atom.find_bonds_c is not None:
+        results["cython"] = atom.find_bonds_c(is_h, coords, cg2, ch2)
+
+    return {name: set(zip(i.tolist(), j.tolist())) for name, (i, j) in results.items()}
+
+
+def assert_backends_agree(labels, coords):
+    pairs = backend_pairs(labels, coords)
+    expected = pairs.pop("numpy")
+    for name, found in pairs.items():
+        assert found == expected, name
+    return expected
+
+
+@pytest.mark.parametrize("name", ["aspirin.xyz", "alanine-tripeptide.xyz", "C180-0.xyz"])
+def test_backends_agree_on_molecule(name):
+    labels, coords = read_xyz(name)
+    assert len(assert_backends_agree(labels, coords)) > 0
+
+
+@pytest.mark.parametrize("labels, coords", [([], []), (["C"], [[0.0, 0.0, 0.0]])])
+def test_no_bonds(labels, coords):
+    assert all(len(found) == 0 for found in backend_pairs(labels, coords).values())
+
+    pair_bond, bond_dist = atom.find_bonds(labels, coords)
+    assert pair_bond == []
+    assert bond_dist.shape == (0, 2, 3)
+
+
+@pytest.mark.parametrize("offset", [-1, 0])
+def test_kdtree_threshold(offset):
+    labels, coords = read_xyz("aspirin.xyz")
+    single, _ = atom.find_bonds(labels, coords)
+
+    # just below and at the k-d tree threshold
+    copies = atom._KDTREE_MIN_ATOMS // len(labels) + 1
+    big_labels, big_coords = replicate(labels, coords, copies)
+    n = atom._KDTREE_MIN_ATOMS + offset
+    big_labels, big_coords = big_labels[:n], big_coords[:n]
+
+    expected = assert_backends_agree(big_labels, big_coords)
+    pair_bond, bond_dist = atom.find_bonds(big_labels, big_coords)
+    assert len(pair_bond) == len(expected) == len(bond_dist)
+    assert len(pair_bond) >= (n // len(labels)) * len(single)